@@ -97,7 +97,7 @@ instead of the constructor Calculation()."""
             A calculation associated with the given path.
         """
         calc = cls(_internal=True)
-        calc._path = pathlib.Path(path_name).expanduser().resolve()
+        calc._path = _resolve_path(path_name)
         calc._file = None
         return calc
 
@@ -156,6 +156,14 @@ instead of the constructor Calculation()."""
     #     self._POSCAR.write(str(poscar))
 
 
+def _resolve_path(path_name):
+    # the default calculation creates a new instance for every attribute access and
+    # the current working directory is already an absolute path without symbolic links
+    if path_name == ".":
+        return pathlib.Path.cwd()
+    return pathlib.Path(path_name).expanduser().resolve()
+
+
 def _add_all_refinement_classes(calc):
     for quantity in QUANTITIES:
         setattr(calc, quantity, _make_property(quantity))
@@ -182,18 +190,19 @@ def _make_property(quantity):
 
 
 def _make_group(group_name, quantities):
-    # The Group class for each group is constructed on the fly. Alternatively you could
-    # create a Group for every instance needed and construct the required properties as
-    # needed. It is important that they are distinct classes.
+    # The Group class for each group is constructed once when the group is added, so
+    # that accessing the group only creates a new instance. It is important that they
+    # are distinct classes, because the properties are set on the class.
+    class Group:
+        def __init__(self, calculation):
+            self._path = calculation._path
+            self._file = calculation._file
+
+    for quantity in quantities:
+        full_name = f"{group_name}_{quantity}"
+        setattr(Group, quantity, _make_property(full_name))
+
     def get_group(self):
-        class Group:
-            def __init__(self, calculation):
-                self._path = calculation._path
-                self._file = calculation._file
-
-        for quantity in quantities:
-            full_name = f"{group_name}_{quantity}"
-            setattr(Group, quantity, _make_property(full_name))
         return Group(self)
 
     return property(get_group)
@@ -18,18 +18,26 @@ def data_access(func):
     these will be handled iteratively and returned as a dictionary. Any remaining
     selection not matching a source is passed to the inner function."""
 
+    signature = _signature_without_self(func)
+
     @functools.wraps(func)
     def func_with_access(self, *args, **kwargs):
-        wrapper = _FunctionWrapper(func, self)
+        wrapper = _FunctionWrapper(func, signature, self)
         return wrapper.run(*args, **kwargs)
 
     return func_with_access
 
 
+def _signature_without_self(func):
+    signature = inspect.signature(func)
+    _self, *parameters = signature.parameters.values()
+    return signature.replace(parameters=parameters)
+
+
 class Refinery:
     def __init__(self, data_context, **kwargs):
         self._data_context = data_context
-        self._path = kwargs.get("path") or pathlib.Path.cwd()
+        self._path_argument = kwargs.get("path")
         self._repr = kwargs.get("repr", f"({repr(data_context)})")
         self.__post_init__()
 
@@ -118,6 +126,11 @@ class Refinery:
         "Returns the path from which the output is obtained."
         return self._path
 
+    @property
+    def _path(self):
+        # without a path, the output is read relative to the directory at access time
+        return self._path_argument or pathlib.Path.cwd()
+
     @property
     def _raw_data(self):
         return self._data_context.data
@@ -172,9 +185,10 @@ def _get_path_to_file(file):
 
 
 class _FunctionWrapper:
-    def __init__(self, func, refinery):
+    def __init__(self, func, signature, refinery):
         self._data_context = refinery._data_context
         self._func = functools.partial(func, refinery)
+        self._signature = signature
 
     def run(self, *args, **kwargs):
         selection, bound_arguments = self._find_selection_in_arguments(*args, **kwargs)
@@ -183,7 +197,7 @@ class _FunctionWrapper:
         return self._merge_results(results)
 
     def _find_selection_in_arguments(self, *args, **kwargs):
-        signature = inspect.signature(self._func)
+        signature = self._signature
         if "selection" in signature.parameters:
             return self._get_selection_from_parameters(signature, *args, **kwargs)
         elif selection := kwargs.pop("selection", None):
@@ -326,6 +340,7 @@ class _DataAccess(contextlib.AbstractContextManager):
         self._counter -= 1
         if self._counter == 0:
             self.selection = None
+            self.data = None
             self._stack.close()
 
     def set_selection(self, selection):
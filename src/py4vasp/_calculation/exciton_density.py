@@ -55,7 +55,9 @@ class ExcitonDensity(base.Refinery, structure.Mixin, view.Mixin):
         np.ndarray
             Charge density of all excitons.
         """
-        return np.moveaxis(self._raw_data.exciton_charge, 0, -1).T
+        exciton_charge = self._raw_data.exciton_charge[:]
+        excitons_first_then_x_y_z = (0, 3, 2, 1)
+        return np.ascontiguousarray(exciton_charge.transpose(excitons_first_then_x_y_z))
 
     @base.data_access
     def to_view(self, selection=None, supercell=None, center=False, **user_options):
@@ -98,12 +100,12 @@ class ExcitonDensity(base.Refinery, structure.Mixin, view.Mixin):
         _raise_error_if_no_data(self._raw_data.exciton_charge)
         selection = selection or _DEFAULT_SELECTION
         viewer = self._structure.plot(supercell)
-        map_ = self._create_map()
-        selector = index.Selector({0: map_}, self._raw_data.exciton_charge)
-        tree = select.Tree.from_selection(selection)
+        selections = list(select.Tree.from_selection(selection).selections())
+        exciton_charge, map_ = self._read_selected_excitons(selections)
+        selector = index.Selector({0: map_}, exciton_charge)
         viewer.grid_scalars = [
-            self._grid_quantity(selector, selection, map_, user_options)
-            for selection in tree.selections()
+            self._grid_quantity(selector, exciton_charge, selection, map_, user_options)
+            for selection in selections
         ]
         if center:
             viewer.shift = (0.5, 0.5, 0.5)
@@ -113,10 +115,26 @@ class ExcitonDensity(base.Refinery, structure.Mixin, view.Mixin):
         num_excitons = self._raw_data.exciton_charge.shape[0]
         return {str(choice + 1): choice for choice in range(num_excitons)}
 
-    def _grid_quantity(self, selector, selection, map_, user_options):
+    def _read_selected_excitons(self, selections):
+        map_ = self._create_map()
+        indices = set()
+        for selection in selections:
+            indices.update(_exciton_indices(selection, map_))
+        indices = sorted(indices)
+        exciton_charge = self._raw_data.exciton_charge[indices]
+        map_ = {str(index + 1): position for position, index in enumerate(indices)}
+        return exciton_charge, map_
+
+    def _grid_quantity(self, selector, exciton_charge, selection, map_, user_options):
+        if _is_single_exciton(selection, map_):
+            (label,) = selection
+            density = exciton_charge[map_[label]]
+        else:
+            label = selector.label(selection)
+            density = selector[selection]
         return view.GridQuantity(
-            quantity=(selector[selection].T)[np.newaxis],
-            label=selector.label(selection),
+            quantity=(density.T)[np.newaxis],
+            label=label,
             isosurfaces=self._isosurfaces(**user_options),
         )
 
@@ -125,6 +143,29 @@ class ExcitonDensity(base.Refinery, structure.Mixin, view.Mixin):
         return [view.Isosurface(isolevel, color, opacity)]
 
 
+def _exciton_indices(selection, map_):
+    for part in selection:
+        if isinstance(part, str) and part in map_:
+            yield map_[part]
+        elif _is_range(part):
+            bounds = [map_[label] for label in part.group if label in map_]
+            if len(bounds) == 2:
+                yield from range(min(bounds), max(bounds) + 1)
+        elif isinstance(part, select.Operation):
+            yield from _exciton_indices(part.left_operand, map_)
+            yield from _exciton_indices(part.right_operand, map_)
+
+
+def _is_range(part):
+    return isinstance(part, select.Group) and part.separator == select.range_separator
+
+
+def _is_single_exciton(selection, map_):
+    return (
+        len(selection) == 1 and isinstance(selection[0], str) and selection[0] in map_
+    )
+
+
 def _raise_error_if_no_data(data):
     if data.is_none():
         raise exception.NoData(
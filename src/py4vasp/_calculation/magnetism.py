@@ -82,11 +82,15 @@ class Magnetism(slice_.Mixin, base.Refinery, structure.Mixin, view.Mixin):
 
         {examples}
         """
-        return {
-            "charges": self.charges(),
-            "moments": self.moments(),
-            **self._add_spin_and_orbital_moments(),
-        }
+        result = {"charges": self.charges()}
+        if self._has_orbital_moments:
+            spin_moments, orbital_moments, moments = self._noncollinear_components()
+            result["moments"] = _move_direction_to_last_axis(moments)
+            result["spin_moments"] = _move_direction_to_last_axis(spin_moments)
+            result["orbital_moments"] = _move_direction_to_last_axis(orbital_moments)
+        else:
+            result["moments"] = self.moments()
+        return result
 
     @base.data_access
     @documentation.format(
@@ -206,7 +210,11 @@ class Magnetism(slice_.Mixin, base.Refinery, structure.Mixin, view.Mixin):
 
         {examples}
         """
-        return _sum_over_orbitals(self.moments(selection), is_vector=self._noncollinear)
+        if self._noncollinear:
+            self._raise_error_if_steps_out_of_bounds()
+            self._raise_error_if_selection_not_available(selection)
+            return self._total_noncollinear_moments(selection)
+        return _sum_over_orbitals(self.moments(selection))
 
     @property
     def _only_charge(self):
@@ -225,19 +233,28 @@ class Magnetism(slice_.Mixin, base.Refinery, structure.Mixin, view.Mixin):
         return not self._raw_data.orbital_moments.is_none()
 
     def _collinear_moments(self):
-        return self._raw_data.spin_moments[self._steps, 1]
+        return np.ascontiguousarray(self._raw_data.spin_moments[self._steps, 1])
 
     def _noncollinear_moments(self, selection):
-        spin_moments = self._spin_moments()
-        orbital_moments = self._orbital_moments(spin_moments)
+        spin_moments, orbital_moments, moments = self._noncollinear_components()
         if selection == "orbital":
             moments = orbital_moments
         elif selection == "spin":
             moments = spin_moments
-        else:
-            moments = spin_moments + orbital_moments
-        direction_axis = 1 if moments.ndim == 4 else 0
-        return np.moveaxis(moments, direction_axis, -1)
+        return _move_direction_to_last_axis(moments)
+
+    def _noncollinear_components(self):
+        spin_moments = self._spin_moments()
+        orbital_moments = self._orbital_moments(spin_moments)
+        return spin_moments, orbital_moments, spin_moments + orbital_moments
+
+    def _total_noncollinear_moments(self, selection):
+        moments = []
+        if selection != "orbital":
+            moments.append(self._spin_moments())
+        if selection != "spin" and self._has_orbital_moments:
+            moments.append(self._raw_data.orbital_moments[self._steps])
+        return sum(_sum_vector_over_orbitals(moment) for moment in moments)
 
     def _spin_moments(self):
         return self._raw_data.spin_moments[self._steps, 1:]
@@ -249,17 +266,6 @@ class Magnetism(slice_.Mixin, base.Refinery, structure.Mixin, view.Mixin):
         orbital_moments = self._raw_data.orbital_moments[self._steps]
         return np.concatenate((zero_s_moments, orbital_moments), axis=-1)
 
-    def _add_spin_and_orbital_moments(self):
-        if not self._has_orbital_moments:
-            return {}
-        spin_moments = self._spin_moments()
-        orbital_moments = self._orbital_moments(spin_moments)
-        direction_axis = 1 if spin_moments.ndim == 4 else 0
-        return {
-            "spin_moments": np.moveaxis(spin_moments, direction_axis, -1),
-            "orbital_moments": np.moveaxis(orbital_moments, direction_axis, -1),
-        }
-
     def _prepare_magnetic_moments_for_plotting(self, selection):
         moments = self.total_moments(selection)
         moments = self._make_sure_moments_have_timestep_dimension(moments)
@@ -278,8 +284,8 @@ class Magnetism(slice_.Mixin, base.Refinery, structure.Mixin, view.Mixin):
 
     def _raise_error_if_steps_out_of_bounds(self):
         try:
-            np.zeros(self._raw_data.spin_moments.shape[0])[self._steps]
-        except IndexError as error:
+            range(self._raw_data.spin_moments.shape[0])[self._steps]
+        except (IndexError, TypeError) as error:
             raise exception.IncorrectUsage(
                 f"Error reading the magnetic moments. Please check if the steps "
                 f"`{self._steps}` are properly formatted and within the boundaries."
@@ -299,14 +305,22 @@ class Magnetism(slice_.Mixin, base.Refinery, structure.Mixin, view.Mixin):
         )
 
 
-def _sum_over_orbitals(quantity, is_vector=False):
+def _sum_over_orbitals(quantity):
     if quantity is None:
         return None
-    if is_vector:
-        return np.sum(quantity, axis=-2)
     return np.sum(quantity, axis=-1)
 
 
+def _move_direction_to_last_axis(moments):
+    direction_axis = 1 if moments.ndim == 4 else 0
+    return np.ascontiguousarray(np.moveaxis(moments, direction_axis, -1))
+
+
+def _sum_vector_over_orbitals(moments):
+    # sum over orbitals and move the direction to the last axis in a single pass
+    return np.ascontiguousarray(np.einsum("...dao->...ad", moments))
+
+
 def _convert_moment_to_3d_vector(moments):
     if moments is not None and moments.ndim == 2:
         moments = moments.reshape((*moments.shape, 1))
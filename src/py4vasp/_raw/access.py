@@ -11,6 +11,18 @@ from py4vasp import exception, raw
 from py4vasp._raw.definition import DEFAULT_FILE, DEFAULT_SOURCE, schema
 from py4vasp._raw.schema import Length, Link, error_message
 
+_OPEN_OPTIONS = {
+    "libver": "latest",
+    "rdcc_nbytes": 4 * 1024 * 1024,
+    "rdcc_nslots": 1009,
+}
+"""Options to open the HDF5 files. The chunk cache of every chunked dataset, e.g. a charge
+density, that is read holds up to 4 MiB until the access ends. So in the worst case, an
+access uses 4 MiB of additional memory per chunked dataset it reads."""
+_METADATA_CACHE_BYTES = 128 * 1024 * 1024
+"Fixed size of the metadata cache, so the groups of vaspout.h5 are not reread."
+_RESIZE_OFF = 0  # H5C_incr__off, H5C_flash_incr__off, and H5C_decr__off
+
 
 @contextlib.contextmanager
 def _access(quantity, *, selection=None, path=None, file=None):
@@ -54,9 +66,12 @@ def access(*args, **kwargs):
 
 
 class _State:
+    __slots__ = ("exit_stack", "_files", "_versions", "_path", "_file")
+
     def __init__(self, path, file):
         self.exit_stack = contextlib.ExitStack()
         self._files = {}
+        self._versions = {}
         self._path = path or pathlib.Path(".")
         self._file = file
 
@@ -65,7 +80,7 @@ class _State:
         filename = self._file or source.file or DEFAULT_FILE
         path = self._path / pathlib.Path(filename)
         h5f = self._open_file(path)
-        self._check_version(h5f, source.required, quantity)
+        self._check_version(path, h5f, source.required, quantity)
         datasets = self._get_datasets(h5f, source.data)
         return dataclasses.replace(source.data, **datasets)
 
@@ -87,7 +102,7 @@ class _State:
 
     def _create_and_enter_context(self, filename):
         try:
-            h5f = h5py.File(filename, "r")
+            h5f = h5py.File(filename, "r", **_OPEN_OPTIONS)
         except FileNotFoundError as error:
             message = (
                 f"{filename} could not be opened. Please make sure the file exists."
@@ -99,20 +114,27 @@ class _State:
                 "format is correct and you have the permissions to read it."
             )
             raise exception.FileAccessError(message)
-        return self.exit_stack.enter_context(h5f)
+        h5f = self.exit_stack.enter_context(h5f)
+        _configure_metadata_cache(h5f)
+        return h5f
 
-    def _check_version(self, h5f, required, quantity):
+    def _check_version(self, filename, h5f, required, quantity):
         if not required:
             return
-        version = raw.Version(
-            major=h5f[schema.version.major][()],
-            minor=h5f[schema.version.minor][()],
-            patch=h5f[schema.version.patch][()],
-        )
+        version = self._read_version(filename, h5f)
         if version < required:
             message = f"The {quantity} is not available in VASP {version}. It requires at least {required}."
             raise exception.OutdatedVaspVersion(message)
 
+    def _read_version(self, filename, h5f):
+        if filename not in self._versions:
+            self._versions[filename] = raw.Version(
+                major=h5f[schema.version.major][()],
+                minor=h5f[schema.version.minor][()],
+                patch=h5f[schema.version.patch][()],
+            )
+        return self._versions[filename]
+
     def _get_datasets(self, h5f, data):
         return {
             field.name: self._get_dataset(h5f, getattr(data, field.name))
@@ -126,7 +148,7 @@ class _State:
             return self.access(key.quantity, source=key.source)
         if isinstance(key, Length):
             dataset = h5f.get(key.dataset)
-            return len(dataset) if dataset else None
+            return dataset.shape[0] if dataset is not None else None
         return self._parse_dataset(h5f.get(key))
 
     def _parse_dataset(self, dataset):
@@ -136,5 +158,17 @@ class _State:
         return result
 
 
+def _configure_metadata_cache(h5f):
+    config = h5f.id.get_mdc_config()
+    config.set_initial_size = True
+    config.initial_size = _METADATA_CACHE_BYTES
+    config.min_size = _METADATA_CACHE_BYTES
+    config.max_size = _METADATA_CACHE_BYTES
+    config.incr_mode = _RESIZE_OFF
+    config.flash_incr_mode = _RESIZE_OFF
+    config.decr_mode = _RESIZE_OFF
+    h5f.id.set_mdc_config(config)
+
+
 def _is_scalar(data):
     return not data.is_none() and data.ndim == 0
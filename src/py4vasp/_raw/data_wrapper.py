@@ -27,6 +27,8 @@ class VaspData(np.lib.mixins.NDArrayOperatorsMixin):
         The data wrapped by this container.
     """
 
+    __slots__ = ("_data", "_repr_data")
+
     def __init__(self, data):
         if data is None:
             self._data = None
@@ -1,8 +1,5 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
-import contextlib
-import os
-
 from py4vasp._util import import_
 
 IPython = import_.optional("IPython")
@@ -14,9 +11,8 @@ def set_error_handling(verbosity):
     ipython = _get_ipython()
     if ipython is None:
         _ERROR_VERBOSITY = verbosity
-    else:
-        with open(os.devnull, "w") as ignore, contextlib.redirect_stdout(ignore):
-            ipython.magic(f"xmode {verbosity}")
+    elif ipython.InteractiveTB.mode != verbosity.capitalize():
+        ipython.InteractiveTB.set_mode(mode=verbosity.capitalize())
 
 
 def error_handling():
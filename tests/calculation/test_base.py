@@ -130,6 +130,12 @@ def test_nested_calls(mock_access):
     mock_access.assert_called_once_with("example", selection=None, path=pathname)
 
 
+def test_raw_data_released_after_access(mock_access):
+    example = Example.from_path()
+    assert example.read() == RAW_DATA.content
+    assert example._data_context.data is None
+
+
 def test_arguments_passed(mock_schema):
     example = Example.from_data(RAW_DATA)
     mandatory = "mandatory argument"
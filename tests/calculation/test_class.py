@@ -28,6 +28,12 @@ def test_creation_from_path(mock_access, mock_from_path):
     mock_from_path.assert_called_once()
 
 
+def test_creation_from_current_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calc = Calculation.from_path(".")
+    assert calc.path() == Path(".").resolve()
+
+
 @patch.object(base.Refinery, "from_file", autospec=True)
 @patch("py4vasp.raw.access", autospec=True)
 def test_creation_from_file(mock_access, mock_from_file):
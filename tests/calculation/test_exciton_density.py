@@ -77,6 +77,21 @@ def test_plot_addition(exciton_density, Assert):
     Assert.allclose(grid_scalar.quantity, selected_exciton)
 
 
+def test_plot_range(exciton_density, Assert):
+    view = exciton_density.plot("2:3")
+    assert len(view.grid_scalars) == 1
+    grid_scalar = view.grid_scalars[0]
+    selected_exciton = exciton_density.ref.density[1] + exciton_density.ref.density[2]
+    Assert.allclose(grid_scalar.quantity, selected_exciton)
+
+
+def test_plot_incorrect_selection(exciton_density):
+    with pytest.raises(exception.IncorrectUsage):
+        exciton_density.plot("4")
+    with pytest.raises(exception.IncorrectUsage):
+        exciton_density.plot("1 + 4")
+
+
 def test_plot_centered(exciton_density, Assert):
     view = exciton_density.plot()
     assert view.shift is None
@@ -97,6 +97,14 @@ def test_moments(example_magnetism, steps, Assert):
     Assert.allclose(magnetism.moments(), example_magnetism.ref.moments[steps])
 
 
+def test_moments_contiguous(example_magnetism, steps):
+    magnetism = example_magnetism[steps] if steps != -1 else example_magnetism
+    if example_magnetism.ref.kind == "charge_only":
+        pytest.skip("Charge-only calculations do not have magnetic moments.")
+    assert magnetism.moments().flags.c_contiguous
+    assert magnetism.total_moments().flags.c_contiguous
+
+
 def test_moments_selection(example_magnetism, Assert):
     magnetism = example_magnetism
     Assert.allclose(magnetism.moments("total"), magnetism.ref.moments[-1])
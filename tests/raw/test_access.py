@@ -4,12 +4,18 @@ import pathlib
 from dataclasses import fields
 from unittest.mock import MagicMock, call, patch
 
+import h5py
 import numpy as np
 import pytest
 from util import VERSION
 
 import py4vasp.raw as raw
 from py4vasp import exception
+from py4vasp._raw.access import (
+    _METADATA_CACHE_BYTES,
+    _OPEN_OPTIONS,
+    _configure_metadata_cache,
+)
 from py4vasp._raw.definition import DEFAULT_FILE
 
 
@@ -87,7 +93,7 @@ def test_access_with_link(mock_access):
     mock_file, sources = mock_access
     source = sources[quantity]["default"]
     with raw.access(quantity) as with_link:
-        file_calls += [call(pathlib.Path(DEFAULT_FILE), "r")]
+        file_calls += [call(pathlib.Path(DEFAULT_FILE), "r", **_OPEN_OPTIONS)]
         get_calls += list(expected_calls(source))
         check_file_access(mock_file, file_calls, get_calls)
         check_data(with_link.baz, source.data.baz)
@@ -188,10 +194,9 @@ def test_access_length(mock_access):
     mock_get = mock_file.return_value.__enter__.return_value.get
     source = sources[quantity]["default"]
     mock_data = mock_read_result(source.data.num_data.dataset)
-    mock_data.__len__.side_effect = (num_data,)
+    mock_data.shape = (num_data,)
     with raw.access(quantity) as with_length:
         mock_get.assert_called_once_with(source.data.num_data.dataset)
-        mock_data.__len__.assert_called_once_with()
         assert with_length.num_data == num_data
     mock_get.side_effect = (None,)
     with raw.access(quantity) as with_length:
@@ -210,7 +215,7 @@ def test_access_version(mock_access):
 
 
 def check_single_file_access(mock_file, filename, source):
-    file_calls = (call(pathlib.Path(filename), "r"),)
+    file_calls = (call(pathlib.Path(filename), "r", **_OPEN_OPTIONS),)
     check_file_access(mock_file, file_calls, expected_calls(source))
 
 
@@ -263,3 +268,31 @@ def test_access_without_keyword(mock_access):
     with pytest.raises(exception.IncorrectUsage):
         with raw.access("simple", "further arguments are keyword only"):
             pass
+
+
+def test_access_file_opened_elsewhere(complex_schema, tmp_path):
+    schema, sources = complex_schema
+    source = sources["simple"]["default"]
+    filename = tmp_path / source.file
+    with h5py.File(filename, "w") as h5f:
+        h5f[source.data.foo] = EXAMPLE_SCALAR
+        h5f[source.data.bar] = EXAMPLE_ARRAY
+    with patch("py4vasp._raw.access.schema", schema), h5py.File(filename, "r"):
+        with raw.access("simple", path=tmp_path) as simple:
+            assert simple.foo == EXAMPLE_SCALAR
+            assert np.array_equal(simple.bar[:], EXAMPLE_ARRAY)
+
+
+def test_metadata_cache_has_fixed_size(tmp_path):
+    with h5py.File(tmp_path / "example.h5", "w") as h5f:
+        _configure_metadata_cache(h5f)
+        config = h5f.id.get_mdc_config()
+        max_size, _, _, _ = h5f.id.get_mdc_size()
+    assert config.initial_size == _METADATA_CACHE_BYTES
+    assert config.min_size == _METADATA_CACHE_BYTES
+    assert config.max_size == _METADATA_CACHE_BYTES
+    assert max_size == _METADATA_CACHE_BYTES
+    # HDF5 enables all three resize modes by default, 0 is the "off" value for each
+    assert config.incr_mode == 0
+    assert config.flash_incr_mode == 0
+    assert config.decr_mode == 0
@@ -14,6 +14,14 @@ def test_no_error_handling_outside_ipython():
 def test_set_error_handling(capsys, not_core):
     with patch("IPython.get_ipython") as mock:
         interactive.set_error_handling("Minimal")
-        mock.return_value.magic.assert_called_once_with("xmode Minimal")
+        set_mode = mock.return_value.InteractiveTB.set_mode
+        set_mode.assert_called_once_with(mode="Minimal")
         output, _ = capsys.readouterr()
         assert output == ""
+
+
+def test_keep_error_handling(not_core):
+    with patch("IPython.get_ipython") as mock:
+        mock.return_value.InteractiveTB.mode = "Minimal"
+        interactive.set_error_handling("Minimal")
+        mock.return_value.InteractiveTB.set_mode.assert_not_called()